@@ -1,7 +1,11 @@
+import errno
+import hashlib
+import multiprocessing
 import os
 import sys
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -11,19 +15,36 @@ except Exception:
     raise
 
 try:
-    from sklearn.cluster import KMeans
+    from sklearn.cluster import KMeans, MiniBatchKMeans
     from sklearn.preprocessing import StandardScaler
-    from sklearn.decomposition import PCA
+    from sklearn.decomposition import PCA, IncrementalPCA
 except Exception:
     KMeans = None
+    MiniBatchKMeans = None
     StandardScaler = None
     PCA = None
+    IncrementalPCA = None
 
 try:
     import cv2
 except Exception:
     cv2 = None
 
+try:
+    import ffmpegcv
+except Exception:
+    ffmpegcv = None
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    import joblib
+except Exception:
+    joblib = None
+
 
 # =============================================================================
 # CONFIGURATION - CUSTOMIZE THESE PATHS FOR YOUR SYSTEM
@@ -49,59 +70,241 @@ categories_folder = os.environ.get(
     str(Path.home() / 'Videos' / 'categorized_videos')
 )
 
+# Bump whenever the feature pipeline changes so stale cache entries are
+# recomputed instead of reused.
+FEATURE_VERSION = 3
+
+# Full feature width: 256 color histogram bins + 32 ORB dims + 64 name-hash
+# dims. The size+name fallback is shorter and gets zero-padded to this.
+FEAT_DIM = 352
+
+# Video file extensions the categorizer will pick up
+VID_EXTS = ('.mp4', '.mov', '.webm', '.avi')
+
+# Where per-video feature vectors are cached between runs
+feature_cache_folder = str(Path.home() / '.cache' / 'desktok' / 'features')
+
+# Where fitted scaler/PCA/KMeans models are cached between runs
+cluster_cache_folder = str(Path.home() / '.cache' / 'desktok' / 'cluster')
+
+# One ORB detector per process — rebuilding the 500-feature table for
+# every video is wasted work. Each pool worker constructs its own copy on
+# import. When the OpenCV OpenCL path is available, enable it so that
+# detectAndCompute on a UMat runs on the GPU.
+_orb = None
+_use_opencl = False
+if cv2 is not None:
+    try:
+        _orb = cv2.ORB_create(500)
+    except Exception:
+        _orb = None
+    try:
+        if cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
+            _use_opencl = cv2.ocl.useOpenCL()
+    except Exception:
+        _use_opencl = False
+
 # Helper functions
+def _feature_cache_path(video_path):
+    digest = hashlib.sha1(os.path.abspath(video_path).encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+    return os.path.join(feature_cache_folder, digest + '.npz')
+
+# When numba is installed, tokenize-and-hash runs as one compiled pass over
+# the name's bytes; cache=True persists the machine code so the compile
+# cost is paid once, not once per process.
+_hash_name_bytes = None
+if njit is not None:
+    @njit(cache=True)
+    def _hash_name_bytes(buf, out):
+        dim = out.shape[0]
+        running = 0
+        in_tok = False
+        for i in range(buf.shape[0]):
+            b = buf[i]
+            if (48 <= b <= 57) or (97 <= b <= 122):
+                running += b
+                in_tok = True
+            elif in_tok:
+                out[running % dim] += 1.0
+                running = 0
+                in_tok = False
+        if in_tok:
+            out[running % dim] += 1.0
+
+def _cache_key_for(stat_info):
+    return np.array([stat_info[0], stat_info[1], FEATURE_VERSION], dtype=np.int64)
+
+def _load_cached_features(cache_file, cache_key):
+    try:
+        if os.path.exists(cache_file):
+            with np.load(cache_file) as cached:
+                if np.array_equal(cached['key'], cache_key):
+                    return cached['feat']
+    except Exception:
+        pass
+    return None
+
+def _size_vec(size):
+    # Little-endian bytes of the file size, unpacked in one C call instead
+    # of eight Python-level shift-and-mask steps
+    vec = np.frombuffer(int(size).to_bytes(8, 'little'), dtype=np.uint8).astype(np.float32)
+    return vec / (np.linalg.norm(vec) + 1e-9)
+
 def _text_vector_from_name(name, dim=64):
     name = os.path.basename(name).lower()
-    toks = [t for t in ''.join(ch if ch.isalnum() else ' ' for ch in name).split() if t]
-    vec = np.zeros(dim, dtype=float)
-    for t in toks:
-        h = sum(ord(c) for c in t) % dim
-        vec[h] += 1.0
-    n = np.linalg.norm(vec)
-    if n > 0: vec /= n
-    return vec
-
-def extract_video_features(video_path, num_frames=8):
+    if _hash_name_bytes is not None:
+        buf = np.frombuffer(name.encode('utf-8', 'ignore'), dtype=np.uint8)
+        out = np.zeros(dim, dtype=np.float32)
+        _hash_name_bytes(buf, out)
+        return out
+    # Branchless cleanup: classify all bytes at once with numpy masks and
+    # blend separators in, instead of a per-character isalnum() loop.
+    # Same alphabet as the numba kernel: digits and lowercase ASCII are
+    # token bytes, everything else (including multi-byte UTF-8) splits.
+    b = np.frombuffer(name.encode('utf-8', 'ignore'), dtype=np.uint8).copy()
+    keep = ((b >= 48) & (b <= 57)) | ((b >= 97) & (b <= 122))
+    b[~keep] = 32
+    toks = b.tobytes().decode('ascii').split()
+    if not toks:
+        return np.zeros(dim, dtype=np.float32)
+    hashes = np.fromiter((sum(map(ord, t)) % dim for t in toks), dtype=np.int64, count=len(toks))
+    return np.bincount(hashes, minlength=dim).astype(np.float32)
+
+def _open_capture(video_path):
+    # Prefer ffmpegcv when it's installed: it drives the FFmpeg libraries
+    # directly (NVDEC hardware decode where available) and can resize to
+    # 224x224 during decode, so the caller can skip its own cv2.resize.
+    # Returns (cap, native_resize) — native_resize tells the caller whether
+    # frames already arrive at 224x224.
+    if ffmpegcv is not None:
+        try:
+            return ffmpegcv.VideoCaptureNV(video_path, resize=(224, 224), pix_fmt='bgr24'), True
+        except Exception:
+            pass
+        try:
+            return ffmpegcv.VideoCapture(video_path, resize=(224, 224), pix_fmt='bgr24'), True
+        except Exception:
+            pass
+    return cv2.VideoCapture(video_path), False
+
+def _frame_count(cap):
+    # cv2 answers CAP_PROP_FRAME_COUNT; ffmpegcv exposes .count instead.
+    try:
+        n = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    except Exception:
+        n = 0
+    if n <= 0:
+        n = int(getattr(cap, 'count', 0) or 0)
+    return n
+
+def extract_video_features(video_path, num_frames=8, stat_info=None):
+    # Features only change when the file does, so cache them on disk keyed
+    # by (mtime_ns, size, FEATURE_VERSION). Re-runs and clustering sweeps
+    # then skip decoding entirely for unchanged files. stat_info is an
+    # optional (mtime_ns, size) pair from the directory scan so the file
+    # isn't stat'ed a second time here.
+    cache_file = None
+    cache_key = None
+    size = None
+    try:
+        if stat_info is None:
+            st = os.stat(video_path)
+            stat_info = (st.st_mtime_ns, st.st_size)
+        size = stat_info[1]
+        cache_key = _cache_key_for(stat_info)
+        cache_file = _feature_cache_path(video_path)
+        cached = _load_cached_features(cache_file, cache_key)
+        if cached is not None:
+            return cached
+    except Exception:
+        pass
+
+    feat = _compute_video_features(video_path, num_frames, size=size)
+
+    if feat is not None and cache_file is not None:
+        try:
+            os.makedirs(feature_cache_folder, exist_ok=True)
+            np.savez(cache_file, key=cache_key, feat=feat)
+        except Exception:
+            pass
+    return feat
+
+def _compute_video_features(video_path, num_frames=8, size=None):
+    if size is None:
+        size = os.path.getsize(video_path)
+
     # If cv2 is not available, fall back to simple file-based features
     if cv2 is None:
-        size = os.path.getsize(video_path)
-        size_vec = np.array([(size >> i) & 0xff for i in range(0, 64, 8)], dtype=float)
-        size_vec = size_vec / (np.linalg.norm(size_vec) + 1e-9)
+        size_vec = _size_vec(size)
         text_vec = _text_vector_from_name(video_path, dim=64)
         return np.concatenate([size_vec, text_vec])
 
-    cap = cv2.VideoCapture(video_path)
+    cap, native_resize = _open_capture(video_path)
     if not cap.isOpened():
         return None
 
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    total_frames = _frame_count(cap)
     if total_frames <= 0:
         cap.release()
         return None
 
-    picks = [min(total_frames - 1, int(i * total_frames / max(1, num_frames))) for i in range(num_frames)]
+    picks = sorted({min(total_frames - 1, int(i * total_frames / max(1, num_frames))) for i in range(num_frames)})
 
     color_hist_acc = None
-    try:
-        orb = cv2.ORB_create(500)
-    except Exception:
-        orb = None
-    orb_descs = []
+    orb = _orb
+    # Running descriptor sum: ORB descriptors are uint8, so accumulate in
+    # integers across all frames and divide once at the end, instead of
+    # upcasting each (K, 32) block to float64 and averaging twice.
+    orb_sum = np.zeros(32, dtype=np.int64)
+    orb_count = 0
+
+    # Walk the stream forward with grab() (advances without decoding) and only
+    # retrieve() the sampled frames. This avoids a keyframe seek + redecode per
+    # sample, which cap.set(CAP_PROP_POS_FRAMES, ...) forces on most backends.
+    # ffmpegcv captures read strictly sequentially (no grab/seek), so for
+    # those we step with read() and discard the unsampled frames instead.
+    has_grab = hasattr(cap, 'grab')
+    pos = 0
+    if has_grab and picks[0] > 0:
+        # Seek once to the first pick so leading frames aren't grabbed needlessly.
+        cap.set(cv2.CAP_PROP_POS_FRAMES, picks[0])
+        pos = picks[0]
 
     for fidx in picks:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, fidx)
-        ret, frame = cap.read()
+        ret, frame = False, None
+        if has_grab:
+            ok = True
+            while pos <= fidx:
+                ok = cap.grab()
+                pos += 1
+                if not ok:
+                    break
+            if not ok:
+                break
+            ret, frame = cap.retrieve()
+        else:
+            while pos <= fidx:
+                ret, frame = cap.read()
+                pos += 1
+                if not ret:
+                    break
+            if not ret:
+                break
         if not ret or frame is None:
             continue
-        try:
-            small = cv2.resize(frame, (224, 224))
-        except Exception:
-            continue
+        if native_resize:
+            small = frame
+        else:
+            try:
+                small = cv2.resize(frame, (224, 224))
+            except Exception:
+                continue
 
-        # Color Histogram
+        # Color Histogram — computed on BGR directly; at 8x8x4 = 256 bins
+        # the extra BGR->HSV pass over the frame bought nothing
         try:
-            hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
-            h = cv2.calcHist([hsv], [0,1,2], None, [8,8,4], [0,180,0,256,0,256])
+            h = cv2.calcHist([small], [0,1,2], None, [8,8,4], [0,256,0,256,0,256])
             h = h.flatten()
             if color_hist_acc is None:
                 color_hist_acc = h
@@ -114,9 +317,15 @@ def extract_video_features(video_path, num_frames=8):
         if orb is not None:
             try:
                 gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
-                kps, desc = orb.detectAndCompute(gray, None)
+                if _use_opencl:
+                    kps, desc = orb.detectAndCompute(cv2.UMat(gray), None)
+                    if desc is not None and not isinstance(desc, np.ndarray):
+                        desc = desc.get()
+                else:
+                    kps, desc = orb.detectAndCompute(gray, None)
                 if desc is not None and desc.size:
-                    orb_descs.append(np.mean(desc.astype(float), axis=0))
+                    orb_sum += desc.astype(np.int32).sum(axis=0)
+                    orb_count += desc.shape[0]
             except Exception:
                 pass
 
@@ -124,48 +333,98 @@ def extract_video_features(video_path, num_frames=8):
 
     # If we couldn't get visual descriptors, fall back to size+name
     if color_hist_acc is None:
-        size = os.path.getsize(video_path)
-        size_vec = np.array([(size >> i) & 0xff for i in range(0, 64, 8)], dtype=float)
-        size_vec = size_vec / (np.linalg.norm(size_vec) + 1e-9)
+        size_vec = _size_vec(size)
         text_vec = _text_vector_from_name(video_path, dim=64)
         return np.concatenate([size_vec, text_vec])
 
-    color_hist_acc = color_hist_acc.astype(float)
-    color_hist_acc /= (np.linalg.norm(color_hist_acc) + 1e-9)
-
-    orb_mean = np.zeros(32, dtype=float)
-    if orb_descs:
-        orb_mean = np.mean(np.stack(orb_descs, axis=0), axis=0)
-        orb_mean /= (np.linalg.norm(orb_mean) + 1e-9)
-
-    text_vec = _text_vector_from_name(video_path, dim=64)
-
-    feat = np.concatenate([color_hist_acc[:256], orb_mean[:32], text_vec])
-    feat = feat / (np.linalg.norm(feat) + 1e-9)
+    # Assemble the full vector by slice and normalize once at the end.
+    # The old per-component norms were extra passes whose scaling the
+    # final normalize (and StandardScaler downstream) undid anyway.
+    feat = np.empty(FEAT_DIM, dtype=np.float32)
+    feat[0:256] = color_hist_acc[:256]
+    if orb_count:
+        feat[256:288] = orb_sum[:32] / orb_count
+    else:
+        feat[256:288] = 0.0
+    feat[288:352] = _text_vector_from_name(video_path, dim=64)
+
+    n = np.sqrt(float(feat @ feat)) + 1e-9
+    feat *= 1.0 / n
     return feat
 
+def _extract_worker(job):
+    # Pool workers need a module-level callable; returns the path alongside
+    # the features because imap_unordered does not preserve input order.
+    video_path, mtime_ns, size = job
+    return video_path, extract_video_features(video_path, stat_info=(mtime_ns, size))
+
 def get_all_video_features():
-    # Snapshot the directory so moves during processing don't affect iteration
+    # Snapshot the directory so moves during processing don't affect
+    # iteration. scandir's DirEntry carries cached stat info, so the
+    # (mtime, size) pair for the feature cache comes for free here
+    # instead of a second stat per file.
+    jobs = []
     try:
-        all_files = [f for f in os.listdir(mixed_clips_folder) if f.lower().endswith(('.mp4', '.mov', '.webm', '.avi'))]
+        with os.scandir(mixed_clips_folder) as it:
+            for e in it:
+                if e.is_file() and e.name.lower().endswith(VID_EXTS):
+                    st = e.stat()
+                    jobs.append((e.path, st.st_mtime_ns, st.st_size))
     except FileNotFoundError:
         print(f"Mixed clips folder not found: {mixed_clips_folder}")
         return np.array([]), []
 
-    video_features = []
     video_paths = []
 
-    for video_file in list(all_files):
-        video_path = os.path.normpath(os.path.join(mixed_clips_folder, video_file))
-        print(f"Extracting features from {video_path}...")
-        features = extract_video_features(video_path)
-        if features is not None:
-            video_features.append(features)
-            video_paths.append(video_path)
+    # Each file decodes independently, so fan extraction out across a pool.
+    # Decode-bound work stops scaling past the physical core count, so cap
+    # the pool; fall back to the serial loop if the pool can't start.
+    # Stage 1 (offline): settle the cache in the parent first, so files
+    # with fresh entries never touch the pool, then decode only the stale
+    # ones. Stage 2 below is pure cache reads plus numeric clustering.
+    results = []
+    stale = []
+    for job in jobs:
+        feat = _load_cached_features(_feature_cache_path(job[0]), _cache_key_for(job[1:]))
+        if feat is not None:
+            results.append((job[0], feat))
+        else:
+            stale.append(job)
+
+    workers = min(os.cpu_count() or 1, 8, max(1, len(stale)))
+    decoded = None
+    if stale and workers > 1:
+        try:
+            with multiprocessing.Pool(processes=workers) as pool:
+                decoded = list(pool.imap_unordered(_extract_worker, stale, chunksize=4))
+        except Exception as e:
+            print(f"Parallel extraction unavailable ({e}); falling back to serial.")
+            decoded = None
+
+    if stale and decoded is None:
+        decoded = []
+        for job in stale:
+            print(f"Extracting features from {job[0]}...")
+            decoded.append(_extract_worker(job))
+
+    if decoded:
+        results.extend(decoded)
+
+    # Fill a preallocated float32 matrix instead of np.array() over a list
+    # of float64 rows — half the memory, and sklearn works on float32
+    # downstream without another copy.
+    feats = np.empty((len(results), FEAT_DIM), dtype=np.float32)
+    written = 0
+    for video_path, features in results:
+        if features is None:
+            continue
+        row = np.asarray(features, dtype=np.float32)
+        feats[written, :row.shape[0]] = row
+        feats[written, row.shape[0]:] = 0.0
+        video_paths.append(video_path)
+        written += 1
 
-    if not video_features:
-        return np.array([]), []
-    return np.array(video_features), video_paths
+    return feats[:written], video_paths
 
 def cluster_videos(video_features):
     # If sklearn is not available, fall back to a single cluster
@@ -173,20 +432,57 @@ def cluster_videos(video_features):
         print("sklearn not available — grouping all videos into a single category.")
         return np.zeros(len(video_features), dtype=int)
 
-    # Standardize the features
-    scaler = StandardScaler()
-    video_features_scaled = scaler.fit_transform(video_features)
+    # Refitting scaler/PCA/KMeans on an unchanged library is pure waste,
+    # so the fitted models and labels are cached keyed by a fingerprint
+    # of the feature matrix itself.
+    cache_file = None
+    if joblib is not None:
+        try:
+            digest = hashlib.sha1(np.ascontiguousarray(video_features).tobytes()).hexdigest()[:16]
+            cache_file = os.path.join(cluster_cache_folder, digest + '.joblib')
+            if os.path.exists(cache_file):
+                scaler, reducer, kmeans, labels = joblib.load(cache_file)
+                return labels
+        except Exception:
+            cache_file = None
+
+    # Standardize the features. Kept float32 and contiguous end-to-end:
+    # sklearn preserves the input dtype, and copy=False avoids a full
+    # duplicate of the matrix at each step.
+    X = np.ascontiguousarray(video_features, dtype=np.float32)
+    scaler = StandardScaler(copy=False)
+    video_features_scaled = scaler.fit_transform(X)
 
     # Apply PCA for dimensionality reduction (to speed up clustering)
     n_components = min(50, max(1, video_features_scaled.shape[1] - 1))
-    pca = PCA(n_components=n_components)
-    reduced_features = pca.fit_transform(video_features_scaled)
 
     # Clustering videos using KMeans (the number of clusters can be adjusted dynamically)
     num_clusters = max(1, int(len(video_features) / 10))  # e.g., 1 cluster per 10 videos
     num_clusters = min(num_clusters, len(video_features))
-    kmeans = KMeans(n_clusters=num_clusters, random_state=42)
+
+    # Large libraries: stream through the data in batches instead of
+    # fitting full-dataset PCA/KMeans, which copy and iterate over the
+    # whole matrix at once. Small libraries keep the exact estimators.
+    if len(video_features) > 2000:
+        reducer = IncrementalPCA(n_components=n_components, batch_size=512)
+        reduced_features = reducer.fit_transform(video_features_scaled)
+        kmeans = MiniBatchKMeans(n_clusters=num_clusters, batch_size=1024, n_init=3, random_state=42)
+    else:
+        # Randomized SVD is O(N*D*k) rather than O(N*D^2) for the k=50
+        # components kept here
+        reducer = PCA(n_components=n_components, svd_solver='randomized', copy=False, random_state=42)
+        reduced_features = reducer.fit_transform(video_features_scaled)
+        kmeans = KMeans(n_clusters=num_clusters, algorithm='elkan', random_state=42)
+
     kmeans.fit(reduced_features)
+
+    if cache_file is not None:
+        try:
+            os.makedirs(cluster_cache_folder, exist_ok=True)
+            joblib.dump((scaler, reducer, kmeans, kmeans.labels_), cache_file)
+        except Exception:
+            pass
+
     return kmeans.labels_
 
 def move_videos_to_categories(video_paths, cluster_labels):
@@ -195,30 +491,56 @@ def move_videos_to_categories(video_paths, cluster_labels):
     failed = 0
     failures = []
 
-    for video_path, label in zip(video_paths, cluster_labels):
-        # Normalize paths
-        src = os.path.normpath(video_path)
-        category_folder = os.path.normpath(os.path.join(categories_folder, f"category_{label}"))
-        os.makedirs(category_folder, exist_ok=True)
-
-        filename = os.path.basename(src)
-        target_path = os.path.normpath(os.path.join(category_folder, filename))
+    # Cross-device moves copy the data and are I/O-bound, so they go
+    # through a thread pool and overlap; same-filesystem moves are a
+    # single os.replace rename and stay inline.
+    pending = []
+
+    # One Path (and one mkdir) per label rather than a
+    # join/normpath/makedirs round per file
+    dst_root = Path(categories_folder)
+    category_dirs = {}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for video_path, label in zip(video_paths, cluster_labels):
+            src = video_path
+            category_dir = category_dirs.get(label)
+            if category_dir is None:
+                category_dir = dst_root / f"category_{label}"
+                category_dir.mkdir(parents=True, exist_ok=True)
+                category_dirs[label] = category_dir
+
+            target_path = str(category_dir / os.path.basename(src))
+
+            if not os.path.exists(src):
+                failed += 1
+                failures.append((src, target_path, 'source-not-found'))
+                print(f"Source not found, skipping: {src}")
+                continue
 
-        if not os.path.exists(src):
-            failed += 1
-            failures.append((src, target_path, 'source-not-found'))
-            print(f"Source not found, skipping: {src}")
-            continue
-
-        try:
-            shutil.move(src, target_path)
-            moved += 1
-            category_folders[label].append(target_path)
-            print(f"Moved: {src} -> {target_path}")
-        except Exception as e:
-            failed += 1
-            failures.append((src, target_path, str(e)))
-            print(f"Failed to move {src} -> {target_path}: {e}")
+            try:
+                os.replace(src, target_path)
+                moved += 1
+                category_folders[label].append(target_path)
+                print(f"Moved: {src} -> {target_path}")
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    pending.append((pool.submit(shutil.move, src, target_path), src, target_path, label))
+                else:
+                    failed += 1
+                    failures.append((src, target_path, str(e)))
+                    print(f"Failed to move {src} -> {target_path}: {e}")
+
+        for future, src, target_path, label in pending:
+            try:
+                future.result()
+                moved += 1
+                category_folders[label].append(target_path)
+                print(f"Moved: {src} -> {target_path}")
+            except Exception as e:
+                failed += 1
+                failures.append((src, target_path, str(e)))
+                print(f"Failed to move {src} -> {target_path}: {e}")
 
     # Report
     print("\n=== Categorization Report ===")
@@ -228,21 +550,33 @@ def move_videos_to_categories(video_paths, cluster_labels):
     for label, videos in category_folders.items():
         print(f"  Category {label} contains {len(videos)} videos.")
 
-    # Write CSV report of failures for debugging
+    # Write CSV report of failures for debugging. Rows are collected up
+    # front and serialized into one in-memory buffer so the file is
+    # written with a single write call instead of one per row.
     try:
         import csv
+        import io
+        rows = [['source','target','status']]
+        rows.extend(failures)
+        # Also list moved items
+        rows.extend(
+            [v, os.path.join(categories_folder, f'category_{label}'), 'moved']
+            for label, videos in category_folders.items() for v in videos
+        )
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
         with open('categorize_report.csv', 'w', newline='', encoding='utf-8') as fh:
-            writer = csv.writer(fh)
-            writer.writerow(['source','target','status'])
-            for s,t,st in failures:
-                writer.writerow([s,t,st])
-            # Also list moved items
-            for label, videos in category_folders.items():
-                for v in videos:
-                    writer.writerow([v, os.path.join(categories_folder, f'category_{label}'), 'moved'])
+            fh.write(buf.getvalue())
     except Exception:
         pass
 
+def precompute_mixed_folder():
+    # Offline stage: decode and cache features without clustering or
+    # moving anything. Meant for a cron job/watcher so the interactive
+    # run only does the cheap numeric part.
+    video_features, video_paths = get_all_video_features()
+    print(f"Features cached for {len(video_paths)} videos.")
+
 def organize_mixed_folder():
     # Step 1: Extract features for all videos
     video_features, video_paths = get_all_video_features()
@@ -261,7 +595,10 @@ def organize_mixed_folder():
 
 if __name__ == '__main__':
     try:
-        organize_mixed_folder()
+        if '--precompute' in sys.argv[1:]:
+            precompute_mixed_folder()
+        else:
+            organize_mixed_folder()
     except Exception as e:
         import traceback
         traceback.print_exc()